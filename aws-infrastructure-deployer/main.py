@@ -1,17 +1,29 @@
 """
 AWS Infrastructure Deployer
-A comprehensive tool for deploying AWS infrastructure using Terraform, Jinja2, and boto3.
+A comprehensive tool for deploying AWS infrastructure using Terraform and botocore.
 """
 
 import os
+import argparse
 import json
+import logging
 import sys
 import time
-from typing import Dict, Optional, Tuple
-from jinja2 import Template
-from python_terraform import Terraform, IsFlagged
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+import functools
+import hashlib
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+# botocore and python_terraform are imported where they are first used so
+# that start-up and prompts are not delayed by their import cost
+if TYPE_CHECKING:
+    import botocore.session
+
+log = logging.getLogger(__name__)
 
 # Configuration Constants
 AMI_OPTIONS = {
@@ -26,227 +38,82 @@ INSTANCE_TYPES = {
 
 AVAILABILITY_ZONES = ["us-east-1a", "us-east-1b"]
 ALLOWED_REGION = "us-east-1"
+DEFAULT_TF_PARALLELISM = 30
 
-# Complete Terraform Template with proper networking
-TERRAFORM_TEMPLATE = """
-provider "aws" {
-  region = "{{ region }}"
-}
-
-# VPC Configuration
-resource "aws_vpc" "main" {
-  cidr_block           = "10.0.0.0/16"
-  enable_dns_hostnames = true
-  enable_dns_support   = true
-  
-  tags = {
-    Name = "main-vpc"
-  }
-}
-
-# Internet Gateway
-resource "aws_internet_gateway" "main" {
-  vpc_id = aws_vpc.main.id
-  
-  tags = {
-    Name = "main-igw"
-  }
-}
-
-# Public Subnets
-resource "aws_subnet" "public" {
-  count                   = 2
-  vpc_id                  = aws_vpc.main.id
-  cidr_block              = "10.0.${count.index + 1}.0/24"
-  availability_zone       = element(["us-east-1a", "us-east-1b"], count.index)
-  map_public_ip_on_launch = true
-  
-  tags = {
-    Name = "public-subnet-${count.index + 1}"
-  }
-}
-
-# Route Table for Public Subnets
-resource "aws_route_table" "public" {
-  vpc_id = aws_vpc.main.id
-  
-  route {
-    cidr_block = "0.0.0.0/0"
-    gateway_id = aws_internet_gateway.main.id
-  }
-  
-  tags = {
-    Name = "public-route-table"
-  }
-}
-
-# Route Table Associations
-resource "aws_route_table_association" "public" {
-  count          = 2
-  subnet_id      = aws_subnet.public[count.index].id
-  route_table_id = aws_route_table.public.id
-}
-
-# Security Group for EC2 Instance
-resource "aws_security_group" "instance_sg" {
-  name        = "instance_security_group"
-  description = "Security group for EC2 instance"
-  vpc_id      = aws_vpc.main.id
-  
-  ingress {
-    from_port       = 80
-    to_port         = 80
-    protocol        = "tcp"
-    security_groups = [aws_security_group.lb_sg.id]
-  }
-  
-  ingress {
-    from_port   = 22
-    to_port     = 22
-    protocol    = "tcp"
-    cidr_blocks = ["0.0.0.0/0"]
-  }
-  
-  egress {
-    from_port   = 0
-    to_port     = 0
-    protocol    = "-1"
-    cidr_blocks = ["0.0.0.0/0"]
-  }
-  
-  tags = {
-    Name = "instance-sg"
-  }
-}
-
-# Security Group for Load Balancer
-resource "aws_security_group" "lb_sg" {
-  name        = "lb_security_group"
-  description = "Allow HTTP inbound traffic for ALB"
-  vpc_id      = aws_vpc.main.id
-  
-  ingress {
-    from_port   = 80
-    to_port     = 80
-    protocol    = "tcp"
-    cidr_blocks = ["0.0.0.0/0"]
-  }
-  
-  egress {
-    from_port   = 0
-    to_port     = 0
-    protocol    = "-1"
-    cidr_blocks = ["0.0.0.0/0"]
-  }
-  
-  tags = {
-    Name = "lb-sg"
-  }
-}
-
-# EC2 Instance
-resource "aws_instance" "web_server" {
-  ami                    = "{{ ami }}"
-  instance_type          = "{{ instance_type }}"
-  subnet_id              = aws_subnet.public[0].id
-  vpc_security_group_ids = [aws_security_group.instance_sg.id]
-  
-  user_data = <<-EOF
-    #!/bin/bash
-    yum update -y
-    yum install -y httpd
-    systemctl start httpd
-    systemctl enable httpd
-    echo "<h1>Hello from $(hostname -f)</h1>" > /var/www/html/index.html
-  EOF
-  
-  tags = {
-    Name = "WebServer"
-  }
-}
-
-# Application Load Balancer
-resource "aws_lb" "application_lb" {
-  name               = "{{ load_balancer_name }}"
-  internal           = false
-  load_balancer_type = "application"
-  security_groups    = [aws_security_group.lb_sg.id]
-  subnets            = aws_subnet.public[*].id
-  
-  enable_deletion_protection = false
-  
-  tags = {
-    Name = "{{ load_balancer_name }}"
-  }
-}
-
-# Target Group
-resource "aws_lb_target_group" "web_target_group" {
-  name     = "web-target-group"
-  port     = 80
-  protocol = "HTTP"
-  vpc_id   = aws_vpc.main.id
-  
-  health_check {
-    enabled             = true
-    healthy_threshold   = 2
-    unhealthy_threshold = 2
-    timeout             = 5
-    interval            = 30
-    path                = "/"
-    matcher             = "200"
-  }
-  
-  tags = {
-    Name = "web-target-group"
-  }
-}
-
-# Target Group Attachment
-resource "aws_lb_target_group_attachment" "web_instance_attachment" {
-  target_group_arn = aws_lb_target_group.web_target_group.arn
-  target_id        = aws_instance.web_server.id
-  port             = 80
-}
-
-# Load Balancer Listener
-resource "aws_lb_listener" "http_listener" {
-  load_balancer_arn = aws_lb.application_lb.arn
-  port              = "80"
-  protocol          = "HTTP"
-  
-  default_action {
-    type             = "forward"
-    target_group_arn = aws_lb_target_group.web_target_group.arn
-  }
-}
+# Settings that make up a deployment configuration, in prompt order
+DEPLOYMENT_KEYS = ("ami", "instance_type", "region", "availability_zone", "load_balancer_name")
 
-# Outputs
-output "instance_id" {
-  description = "ID of the EC2 instance"
-  value       = aws_instance.web_server.id
-}
+# Interactive menu choices
+_AMI_CHOICES = {"1": AMI_OPTIONS["ubuntu"], "2": AMI_OPTIONS["amazon_linux"]}
+_INSTANCE_CHOICES = {"1": INSTANCE_TYPES["t3.small"], "2": INSTANCE_TYPES["t3.medium"]}
+_AZ_CHOICES = {str(i): az for i, az in enumerate(AVAILABILITY_ZONES, 1)}
 
-output "instance_public_ip" {
-  description = "Public IP address of the EC2 instance"
-  value       = aws_instance.web_server.public_ip
+# Shared client configuration: keep-alive connections and adaptive retries
+BOTO_CONFIG_OPTIONS = {
+    "retries": {"max_attempts": 5, "mode": "adaptive"},
+    "max_pool_connections": 20,
+    "tcp_keepalive": True
 }
 
-output "load_balancer_dns" {
-  description = "DNS name of the load balancer"
-  value       = aws_lb.application_lb.dns_name
-}
+# Complete Terraform configuration with proper networking; per-deployment
+# values are supplied through terraform.tfvars.json. Kept on disk and read
+# only when generating so the text is not held in memory for the process life
+TERRAFORM_TEMPLATE_PATH = Path(__file__).resolve().parent / "templates" / "main.tf"
 
-output "load_balancer_arn" {
-  description = "ARN of the load balancer"
-  value       = aws_lb.application_lb.arn
-}
 
-output "vpc_id" {
-  description = "ID of the VPC"
-  value       = aws_vpc.main.id
-}
-"""
+def _parallelism(value: Any, source: str) -> int:
+    """Return value as a positive int, falling back to the default if invalid."""
+    try:
+        parallelism = int(value)
+    except (TypeError, ValueError):
+        parallelism = 0
+    if parallelism < 1:
+        log.warning("Invalid %s '%s', using %d", source, value, DEFAULT_TF_PARALLELISM)
+        return DEFAULT_TF_PARALLELISM
+    return parallelism
+
+
+def _choose(prompt: str, options: Dict[str, Any]) -> Any:
+    """Prompt until one of the option keys is entered and return its value."""
+    keys = " or ".join(options)
+    while True:
+        choice = input(f"{prompt} ({keys}): ").strip()
+        if choice in options:
+            return options[choice]
+        print(f"Invalid choice. Please enter {keys}.")
+
+
+def _load_terraform_template() -> str:
+    """Read the Terraform configuration template from disk."""
+    return TERRAFORM_TEMPLATE_PATH.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session() -> "botocore.session.Session":
+    """Return the shared botocore session."""
+    import botocore.session
+    return botocore.session.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(service: str, region: str):
+    """Return a cached botocore client for the given service and region."""
+    from botocore.config import Config
+    return _get_session().create_client(
+        service, region_name=region, config=Config(**BOTO_CONFIG_OPTIONS)
+    )
+
+
+def _prewarm_clients(region: str) -> None:
+    """Build the clients used for validation ahead of time."""
+    # Built one after another: a botocore session is not safe to share
+    # between threads while creating clients
+    try:
+        for service in ('sts', 'ec2', 'elbv2'):
+            _get_client(service, region)
+    except Exception as e:
+        # The next _get_client call during validation reports the error
+        log.debug("Pre-building AWS clients failed: %s", e)
 
 
 class AWSCredentialsValidator:
@@ -263,97 +130,151 @@ class AWSCredentialsValidator:
         Returns:
             bool: True if credentials are valid, False otherwise
         """
+        from botocore.exceptions import ClientError, NoCredentialsError
+        
+        # Report a clear "no credentials" message up front; the session caches
+        # what it resolves, so creating the STS client does not search again
+        if _get_session().get_credentials() is None:
+            log.error("AWS credentials validation failed: no AWS credentials found")
+            return False
+        
         try:
-            sts_client = boto3.client('sts', region_name=region)
+            sts_client = _get_client('sts', region)
             sts_client.get_caller_identity()
             return True
         except (NoCredentialsError, ClientError) as e:
-            print(f"AWS credentials validation failed: {e}")
+            log.error("AWS credentials validation failed: %s", e)
             return False
 
 
 class TerraformManager:
     """Manages Terraform operations."""
     
-    def __init__(self, working_dir: str):
+    def __init__(self, working_dir: str, parallelism: Optional[int] = None):
         self.working_dir = working_dir
+        if parallelism is not None:
+            self.parallelism = _parallelism(parallelism, "parallelism")
+        elif "TF_PARALLELISM" in os.environ:
+            self.parallelism = _parallelism(os.environ["TF_PARALLELISM"], "TF_PARALLELISM")
+        else:
+            self.parallelism = DEFAULT_TF_PARALLELISM
+        
+        from python_terraform import Terraform
         self.terraform = Terraform(working_dir=working_dir)
         
-    def initialize(self) -> bool:
-        """Initialize Terraform."""
+    def initialize(self, force: bool = False) -> bool:
+        """Initialize Terraform, skipping init if the directory is already initialized."""
         try:
-            print("Initializing Terraform...")
+            providers_dir = os.path.join(self.working_dir, ".terraform", "providers")
+            lock_file = os.path.join(self.working_dir, ".terraform.lock.hcl")
+            if not force and os.path.isdir(providers_dir) and os.path.isfile(lock_file):
+                log.info("Terraform already initialized, skipping init.")
+                return True
+            
+            log.info("Initializing Terraform...")
             return_code, stdout, stderr = self.terraform.init(capture_output=False)
             if return_code != 0:
-                print(f"Terraform init failed: {stderr}")
+                log.error("Terraform init failed: %s", stderr)
                 return False
-            print("Terraform initialized successfully!")
+            log.info("Terraform initialized successfully!")
             return True
         except Exception as e:
-            print(f"Error during Terraform initialization: {e}")
+            log.error("Error during Terraform initialization: %s", e)
             return False
     
     def plan(self) -> bool:
         """Create Terraform plan."""
         try:
-            print("Creating Terraform plan...")
-            return_code, stdout, stderr = self.terraform.plan(capture_output=False)
+            log.info("Creating Terraform plan...")
+            # python-terraform defaults to -detailed-exitcode, which exits 2
+            # when changes are pending; plain exit codes treat that as success
+            return_code, stdout, stderr = self.terraform.plan(
+                capture_output=False,
+                detailed_exitcode=None,
+                parallelism=self.parallelism
+            )
             if return_code != 0:
-                print(f"Terraform plan failed: {stderr}")
+                log.error("Terraform plan failed: %s", stderr)
                 return False
-            print("Terraform plan created successfully!")
+            log.info("Terraform plan created successfully!")
             return True
         except Exception as e:
-            print(f"Error during Terraform planning: {e}")
+            log.error("Error during Terraform planning: %s", e)
             return False
     
     def apply(self) -> Tuple[bool, Dict]:
         """Apply Terraform configuration."""
+        from python_terraform import IsFlagged
+        
         try:
-            print("Applying Terraform configuration...")
+            log.info("Applying Terraform configuration...")
             return_code, stdout, stderr = self.terraform.apply(
                 skip_plan=True, 
                 capture_output=False, 
-                no_color=IsFlagged
+                no_color=IsFlagged,
+                parallelism=self.parallelism
             )
             if return_code != 0:
-                print(f"Terraform apply failed: {stderr}")
+                log.error("Terraform apply failed: %s", stderr)
                 return False, {}
             
-            # Get outputs
-            outputs = self.terraform.output(json=IsFlagged)
-            print("Terraform applied successfully!")
+            # Read outputs from the state apply just wrote
+            outputs = self._read_state_outputs()
+            log.info("Terraform applied successfully!")
             return True, outputs
         except Exception as e:
-            print(f"Error during Terraform apply: {e}")
+            log.error("Error during Terraform apply: %s", e)
             return False, {}
     
-    def destroy(self) -> bool:
-        """Destroy Terraform resources."""
+    def _read_state_outputs(self) -> Dict:
+        """Read root module outputs from the local Terraform state file."""
+        state_file = os.path.join(self.working_dir, "terraform.tfstate")
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return state.get("outputs", {})
+    
+    def destroy(self, parallelism: Optional[int] = None, refresh: bool = False) -> bool:
+        """
+        Destroy Terraform resources.
+        
+        Args:
+            parallelism: Concurrent operations limit, defaults to the manager's setting
+            refresh: Whether to refresh state before destroying
+            
+        Returns:
+            bool: True if resources were destroyed, False otherwise
+        """
+        from python_terraform import IsFlagged
+        
         try:
-            print("Destroying Terraform resources...")
+            log.info("Destroying Terraform resources...")
             return_code, stdout, stderr = self.terraform.destroy(
                 capture_output=False, 
                 no_color=IsFlagged,
-                auto_approve=True
+                auto_approve=True,
+                refresh=refresh,
+                parallelism=(
+                    self.parallelism if parallelism is None
+                    else _parallelism(parallelism, "parallelism")
+                )
             )
             if return_code != 0:
-                print(f"Terraform destroy failed: {stderr}")
+                log.error("Terraform destroy failed: %s", stderr)
                 return False
-            print("Resources destroyed successfully!")
+            log.info("Resources destroyed successfully!")
             return True
         except Exception as e:
-            print(f"Error during Terraform destroy: {e}")
+            log.error("Error during Terraform destroy: %s", e)
             return False
 
 
 class AWSResourceValidator:
-    """Validates AWS resources using boto3."""
+    """Validates AWS resources using botocore."""
     
     def __init__(self, region: str):
         self.region = region
-        self.ec2_client = boto3.client('ec2', region_name=region)
-        self.elbv2_client = boto3.client('elbv2', region_name=region)
+        self.ec2_client = _get_client('ec2', region)
+        self.elbv2_client = _get_client('elbv2', region)
     
     def validate_ec2_instance(self, instance_id: str) -> Dict:
         """
@@ -365,9 +286,24 @@ class AWSResourceValidator:
         Returns:
             Dict: Instance details including state and public IP
         """
+        from botocore.exceptions import ClientError, WaiterError
+        
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
+            # Wait for the instance to reach the running state
+            try:
+                self.ec2_client.get_waiter('instance_running').wait(
+                    InstanceIds=[instance_id],
+                    WaiterConfig={'Delay': 5, 'MaxAttempts': 40}
+                )
+            except WaiterError as e:
+                log.warning("EC2 instance %s did not reach running state: %s", instance_id, e)
+            
+            paginator = self.ec2_client.get_paginator('describe_instances')
+            pages = paginator.paginate(InstanceIds=[instance_id])
+            instance = next(pages.search('Reservations[].Instances[]'), None)
+            if instance is None:
+                log.error("EC2 Instance %s not found", instance_id)
+                return {}
             
             instance_details = {
                 'instance_id': instance_id,
@@ -378,173 +314,229 @@ class AWSResourceValidator:
                 'availability_zone': instance['Placement']['AvailabilityZone']
             }
             
-            print(f"EC2 Instance {instance_id} is in state: {instance_details['state']}")
+            log.info("EC2 Instance %s is in state: %s", instance_id, instance_details['state'])
             return instance_details
             
         except ClientError as e:
-            print(f"Error validating EC2 instance: {e}")
+            log.error("Error validating EC2 instance: %s", e)
             return {}
     
-    def validate_load_balancer(self, lb_dns: str) -> Dict:
+    def validate_load_balancer(self, lb_arn: str) -> Dict:
         """
         Validate Application Load Balancer and return its details.
         
         Args:
-            lb_dns: Load balancer DNS name
+            lb_arn: Load balancer ARN
             
         Returns:
             Dict: Load balancer details including state
         """
+        from botocore.exceptions import ClientError, WaiterError
+        
         try:
-            response = self.elbv2_client.describe_load_balancers()
-            
-            for lb in response['LoadBalancers']:
-                if lb['DNSName'] == lb_dns:
-                    lb_details = {
-                        'dns_name': lb['DNSName'],
-                        'state': lb['State']['Code'],
-                        'type': lb['Type'],
-                        'scheme': lb['Scheme'],
-                        'vpc_id': lb['VpcId']
-                    }
-                    print(f"Load Balancer {lb_dns} is in state: {lb_details['state']}")
-                    return lb_details
-            
-            print(f"Load Balancer with DNS {lb_dns} not found")
-            return {}
+            # Wait for the load balancer to finish provisioning
+            try:
+                self.elbv2_client.get_waiter('load_balancer_available').wait(
+                    LoadBalancerArns=[lb_arn],
+                    WaiterConfig={'Delay': 5, 'MaxAttempts': 24}
+                )
+            except WaiterError as e:
+                log.warning("Load Balancer %s did not become available: %s", lb_arn, e)
+            
+            response = self.elbv2_client.describe_load_balancers(LoadBalancerArns=[lb_arn])
+            
+            if not response['LoadBalancers']:
+                log.error("Load Balancer %s not found", lb_arn)
+                return {}
+            
+            lb = response['LoadBalancers'][0]
+            lb_details = {
+                'dns_name': lb['DNSName'],
+                'state': lb['State']['Code'],
+                'type': lb['Type'],
+                'scheme': lb['Scheme'],
+                'vpc_id': lb['VpcId']
+            }
+            log.info("Load Balancer %s is in state: %s", lb_details['dns_name'], lb_details['state'])
+            return lb_details
             
         except ClientError as e:
-            print(f"Error validating Load Balancer: {e}")
+            if e.response.get('Error', {}).get('Code') == 'LoadBalancerNotFound':
+                log.error("Load Balancer %s not found", lb_arn)
+            else:
+                log.error("Error validating Load Balancer: %s", e)
             return {}
 
 
 class AWSInfrastructureDeployer:
     """Main class for AWS infrastructure deployment."""
     
+    __slots__ = (
+        "terraform_dir",
+        "tf_file",
+        "tfvars_file",
+        "region",
+        "deployment_config",
+        "terraform_outputs",
+        "validation_results",
+        "_tf_path"
+    )
+    
     def __init__(self):
-        self.terraform_dir = "./terraform"
-        self.tf_file = os.path.join(self.terraform_dir, "main.tf")
+        self.terraform_dir = Path("./terraform")
+        self.tf_file = self.terraform_dir / "main.tf"
+        self.tfvars_file = self.terraform_dir / "terraform.tfvars.json"
         self.region = ALLOWED_REGION
         self.deployment_config = {}
         self.terraform_outputs = {}
         self.validation_results = {}
+        self._tf_path = None
+        
+    def _terraform_installed(self) -> bool:
+        """Check whether the Terraform binary is on PATH, caching the result."""
+        if self._tf_path is None:
+            self._tf_path = shutil.which("terraform")
+        return self._tf_path is not None
         
     def get_user_input(self) -> bool:
         """
         Get user input for deployment configuration.
         
+        Only settings not already present in the deployment configuration
+        (e.g. from command-line arguments) are prompted for.
+        
         Returns:
             bool: True if input is valid, False otherwise
         """
-        try:
+        config = self.deployment_config
+        
+        if any(config.get(key) is None for key in DEPLOYMENT_KEYS):
             print("=" * 60)
             print("AWS Infrastructure Deployment Configuration")
             print("=" * 60)
-            
-            # AMI Selection
+        
+        # AMI Selection
+        if config.get('ami') is None:
             print("\nSelect AMI:")
             print("1) Ubuntu 20.04 LTS")
             print("2) Amazon Linux 2")
             
-            while True:
-                ami_choice = input("Choose (1 or 2): ").strip()
-                if ami_choice in ["1", "2"]:
-                    break
-                print("Invalid choice. Please enter 1 or 2.")
-            
-            self.deployment_config['ami'] = (
-                AMI_OPTIONS["ubuntu"] if ami_choice == "1" 
-                else AMI_OPTIONS["amazon_linux"]
-            )
-            
-            # Instance Type Selection
+            config['ami'] = _choose("Choose", _AMI_CHOICES)
+        
+        # Instance Type Selection
+        if config.get('instance_type') is None:
             print("\nSelect instance type:")
             print("1) t3.small")
             print("2) t3.medium")
             
-            while True:
-                inst_choice = input("Choose (1 or 2): ").strip()
-                if inst_choice in ["1", "2"]:
-                    break
-                print("Invalid choice. Please enter 1 or 2.")
-            
-            self.deployment_config['instance_type'] = (
-                INSTANCE_TYPES["t3.small"] if inst_choice == "1" 
-                else INSTANCE_TYPES["t3.medium"]
-            )
-            
-            # Region Validation
+            config['instance_type'] = _choose("Choose", _INSTANCE_CHOICES)
+        
+        # Region Validation
+        if config.get('region') is None:
             region_input = input(f"\nEnter AWS region (default {ALLOWED_REGION}): ").strip()
             if region_input and region_input != ALLOWED_REGION:
                 print(f"Region '{region_input}' is not allowed. Using {ALLOWED_REGION}")
-            self.deployment_config['region'] = ALLOWED_REGION
-            
-            # Availability Zone Selection
+            config['region'] = ALLOWED_REGION
+        
+        # Availability Zone Selection
+        if config.get('availability_zone') is None:
             print(f"\nSelect Availability Zone in region {ALLOWED_REGION}:")
             for i, az in enumerate(AVAILABILITY_ZONES, 1):
                 print(f"{i}) {az}")
             
-            while True:
-                az_choice = input("Choose (1 or 2): ").strip()
-                if az_choice in ["1", "2"]:
-                    break
-                print("Invalid choice. Please enter 1 or 2.")
-            
-            self.deployment_config['availability_zone'] = (
-                AVAILABILITY_ZONES[0] if az_choice == "1" 
-                else AVAILABILITY_ZONES[1]
-            )
-            
-            # Load Balancer Name
+            config['availability_zone'] = _choose("Choose", _AZ_CHOICES)
+        
+        # Load Balancer Name
+        if config.get('load_balancer_name') is None:
             while True:
                 alb_name = input("\nEnter Application Load Balancer name: ").strip()
                 if alb_name and len(alb_name) <= 32:
                     break
                 print("Please enter a valid ALB name (max 32 characters).")
             
-            self.deployment_config['load_balancer_name'] = alb_name
-            
-            print("\n" + "=" * 60)
-            print("Configuration Summary:")
-            print("=" * 60)
-            for key, value in self.deployment_config.items():
-                print(f"{key.replace('_', ' ').title()}: {value}")
-            print("=" * 60)
-            
-            return True
-            
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
-            return False
-        except Exception as e:
-            print(f"Error getting user input: {e}")
-            return False
+            config['load_balancer_name'] = alb_name
+        
+        self._print_config_summary()
+        return True
+    
+    def load_arguments(self, args: argparse.Namespace):
+        """
+        Take deployment configuration from command-line arguments.
+        
+        Options that were not given are left as None for get_user_input
+        to prompt for, except that a missing region defaults to
+        ALLOWED_REGION when there is no terminal to prompt on.
+        
+        Args:
+            args: Parsed command-line arguments
+        """
+        self.deployment_config = {
+            'ami': AMI_OPTIONS[args.ami] if args.ami else None,
+            'instance_type': INSTANCE_TYPES[args.instance_type] if args.instance_type else None,
+            'region': args.region or (None if sys.stdin.isatty() else ALLOWED_REGION),
+            'availability_zone': args.az,
+            'load_balancer_name': args.alb_name
+        }
+    
+    def _print_config_summary(self):
+        """Print the selected deployment configuration."""
+        print("\n" + "=" * 60)
+        print("Configuration Summary:")
+        print("=" * 60)
+        for key, value in self.deployment_config.items():
+            print(f"{key.replace('_', ' ').title()}: {value}")
+        print("=" * 60)
     
     def generate_terraform_file(self) -> bool:
         """
-        Generate Terraform configuration file using Jinja2.
+        Generate Terraform configuration and variables files.
         
         Returns:
             bool: True if file generated successfully, False otherwise
         """
-        try:
-            # Create terraform directory
-            os.makedirs(self.terraform_dir, exist_ok=True)
-            
-            # Render template
-            template = Template(TERRAFORM_TEMPLATE)
-            tf_content = template.render(**self.deployment_config)
-            
-            # Write to file
-            with open(self.tf_file, "w", encoding="utf-8") as f:
-                f.write(tf_content)
-            
-            print(f"Terraform file generated successfully: {self.tf_file}")
-            return True
+        # Create terraform directory
+        self.terraform_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write the static configuration and per-deployment values
+        self._write_if_changed(self.tf_file, _load_terraform_template())
+        self._write_if_changed(
+            self.tfvars_file, json.dumps(self.deployment_config, indent=2)
+        )
+        
+        print(f"Terraform file generated successfully: {self.tf_file}")
+        return True
+    
+    def _write_if_changed(self, path: Path, content: str) -> bool:
+        """
+        Atomically write content to path unless the file already holds it.
+        
+        Args:
+            path: File to write
+            content: Text content to write
             
-        except Exception as e:
-            print(f"Error generating Terraform file: {e}")
+        Returns:
+            bool: True if the file was written, False if it was unchanged
+        """
+        data = content.encode("utf-8")
+        new_hash = hashlib.blake2b(data).digest()
+        if path.exists() and hashlib.blake2b(path.read_bytes()).digest() == new_hash:
             return False
+        
+        fd, tmp_path = tempfile.mkstemp(dir=self.terraform_dir)
+        try:
+            try:
+                # os.write may write fewer bytes than given
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
     
     def deploy_infrastructure(self) -> bool:
         """
@@ -553,88 +545,87 @@ class AWSInfrastructureDeployer:
         Returns:
             bool: True if deployment successful, False otherwise
         """
-        try:
-            # Check if Terraform is installed
-            if not os.system("terraform --version > /dev/null 2>&1") == 0:
-                print("Error: Terraform is not installed or not in PATH.")
-                return False
-            
-            # Initialize Terraform manager
-            tf_manager = TerraformManager(self.terraform_dir)
-            
-            # Initialize Terraform
-            if not tf_manager.initialize():
-                return False
-            
-            # Create plan
-            if not tf_manager.plan():
-                return False
-            
-            # Apply configuration
-            success, outputs = tf_manager.apply()
-            if not success:
-                return False
-            
-            # Store outputs
-            self.terraform_outputs = outputs
-            print("Infrastructure deployed successfully!")
-            return True
-            
-        except Exception as e:
-            print(f"Error deploying infrastructure: {e}")
+        # Check if Terraform is installed
+        if not self._terraform_installed():
+            print("Error: Terraform is not installed or not in PATH.")
+            return False
+        
+        # Initialize Terraform manager
+        tf_manager = TerraformManager(str(self.terraform_dir))
+        
+        # Initialize Terraform
+        if not tf_manager.initialize():
+            return False
+        
+        # Apply configuration (apply computes its own plan)
+        success, outputs = tf_manager.apply()
+        if not success:
+            return False
+        
+        # Store outputs
+        self.terraform_outputs = outputs
+        print("Infrastructure deployed successfully!")
+        return True
+    
+    def plan_infrastructure(self) -> bool:
+        """
+        Show the Terraform plan without applying it.
+        
+        Returns:
+            bool: True if the plan was created, False otherwise
+        """
+        if not self._terraform_installed():
+            print("Error: Terraform is not installed or not in PATH.")
             return False
+        
+        tf_manager = TerraformManager(str(self.terraform_dir))
+        return tf_manager.initialize() and tf_manager.plan()
     
     def validate_deployment(self) -> bool:
         """
-        Validate deployed resources using boto3.
+        Validate deployed resources using botocore.
         
         Returns:
             bool: True if validation successful, False otherwise
         """
-        try:
-            # Validate AWS credentials
-            if not AWSCredentialsValidator.validate_credentials(self.region):
-                return False
-            
-            # Initialize validator
-            validator = AWSResourceValidator(self.region)
-            
-            # Get instance ID and LB DNS from outputs
-            instance_id = self.terraform_outputs.get('instance_id', {}).get('value')
-            lb_dns = self.terraform_outputs.get('load_balancer_dns', {}).get('value')
-            
-            if not instance_id or not lb_dns:
-                print("Error: Missing Terraform outputs for validation")
-                return False
-            
-            # Validate EC2 instance
-            print("Validating EC2 instance...")
-            instance_details = validator.validate_ec2_instance(instance_id)
-            if not instance_details:
-                return False
-            
-            # Validate Load Balancer
-            print("Validating Application Load Balancer...")
-            lb_details = validator.validate_load_balancer(lb_dns)
-            if not lb_details:
-                return False
-            
-            # Store validation results
-            self.validation_results = {
-                'instance_id': instance_details['instance_id'],
-                'instance_state': instance_details['state'],
-                'public_ip': instance_details['public_ip'],
-                'load_balancer_dns': lb_details['dns_name'],
-                'load_balancer_state': lb_details['state'],
-                'validation_timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            print("Deployment validation completed successfully!")
-            return True
-            
-        except Exception as e:
-            print(f"Error validating deployment: {e}")
+        # Validate AWS credentials
+        if not AWSCredentialsValidator.validate_credentials(self.region):
             return False
+        
+        # Initialize validator
+        validator = AWSResourceValidator(self.region)
+        
+        # Get instance ID and LB ARN from outputs
+        instance_id = self.terraform_outputs.get('instance_id', {}).get('value')
+        lb_arn = self.terraform_outputs.get('load_balancer_arn', {}).get('value')
+        
+        if not instance_id or not lb_arn:
+            print("Error: Missing Terraform outputs for validation")
+            return False
+        
+        # Validate EC2 instance and Load Balancer concurrently
+        print("Validating EC2 instance and Application Load Balancer...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            instance_future = executor.submit(validator.validate_ec2_instance, instance_id)
+            lb_future = executor.submit(validator.validate_load_balancer, lb_arn)
+            instance_details = instance_future.result()
+            lb_details = lb_future.result()
+        
+        if not instance_details or not lb_details:
+            return False
+        
+        # Store validation results
+        self.validation_results = {
+            'instance_id': instance_details['instance_id'],
+            'instance_state': instance_details['state'],
+            'public_ip': instance_details['public_ip'],
+            'load_balancer_dns': lb_details['dns_name'],
+            'load_balancer_state': lb_details['state'],
+            'validation_timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        print("Deployment validation completed successfully!")
+        return True
     
     def save_validation_results(self) -> bool:
         """
@@ -643,41 +634,46 @@ class AWSInfrastructureDeployer:
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        try:
-            with open("aws_validation.json", "w", encoding="utf-8") as f:
-                json.dump(self.validation_results, f, indent=4)
-            
-            print("Validation results saved to aws_validation.json")
-            return True
-            
-        except Exception as e:
-            print(f"Error saving validation results: {e}")
-            return False
+        with open("aws_validation.json", "w", encoding="utf-8", buffering=8192) as f:
+            json.dump(self.validation_results, f, indent=2, separators=(",", ": "))
+        
+        print("Validation results saved to aws_validation.json")
+        return True
     
-    def cleanup_resources(self) -> bool:
+    def cleanup_resources(self, assume_yes: bool = False) -> bool:
         """
         Clean up deployed resources.
         
+        Args:
+            assume_yes: Destroy without asking for confirmation
+            
         Returns:
             bool: True if cleanup successful, False otherwise
         """
-        try:
+        if not assume_yes:
+            if not sys.stdin.isatty():
+                print("Cleanup skipped (non-interactive session).")
+                return True
+            
             confirm = input("\nDo you want to destroy the deployed resources? (yes/no): ").strip().lower()
             if confirm != 'yes':
                 print("Cleanup cancelled.")
                 return True
-            
-            tf_manager = TerraformManager(self.terraform_dir)
-            return tf_manager.destroy()
-            
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
+        
+        if not self._terraform_installed():
+            print("Error: Terraform is not installed or not in PATH.")
             return False
+        
+        tf_manager = TerraformManager(str(self.terraform_dir))
+        return tf_manager.destroy()
     
-    def run(self) -> bool:
+    def run(self, args: Optional[argparse.Namespace] = None) -> bool:
         """
         Main execution method.
         
+        Args:
+            args: Parsed command-line arguments; prompts for anything missing
+            
         Returns:
             bool: True if execution successful, False otherwise
         """
@@ -685,7 +681,9 @@ class AWSInfrastructureDeployer:
             print("AWS Infrastructure Deployer")
             print("=" * 60)
             
-            # Get user input
+            # Take configuration from arguments, prompting for anything missing
+            if args is not None:
+                self.load_arguments(args)
             if not self.get_user_input():
                 return False
             
@@ -693,9 +691,20 @@ class AWSInfrastructureDeployer:
             if not self.generate_terraform_file():
                 return False
             
-            # Deploy infrastructure
+            # Show the plan only
+            if args is not None and args.dry_run:
+                return self.plan_infrastructure()
+            
+            # Deploy infrastructure while the AWS clients are built in the
+            # background. The daemon thread is only joined before validation,
+            # so a failed deploy exits without waiting on credential lookup
+            prewarm = threading.Thread(
+                target=_prewarm_clients, args=(self.region,), daemon=True
+            )
+            prewarm.start()
             if not self.deploy_infrastructure():
                 return False
+            prewarm.join()
             
             # Validate deployment
             if not self.validate_deployment():
@@ -716,23 +725,67 @@ class AWSInfrastructureDeployer:
             print("=" * 60)
             
             # Offer cleanup
-            self.cleanup_resources()
+            self.cleanup_resources(assume_yes=args is not None and args.destroy)
             
             return True
             
         except KeyboardInterrupt:
             print("\nOperation cancelled by user.")
             return False
+        except OSError as e:
+            print(f"File error: {e}")
+            return False
         except Exception as e:
             print(f"Unexpected error: {e}")
             return False
 
 
+def _alb_name(value: str) -> str:
+    """Validate a load balancer name given on the command line."""
+    value = value.strip()
+    if not value or len(value) > 32:
+        raise argparse.ArgumentTypeError("must be 1-32 characters")
+    return value
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv: Argument list, defaults to sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Deploy an EC2 instance behind an Application Load Balancer using Terraform."
+    )
+    parser.add_argument("--ami", choices=list(AMI_OPTIONS), help="AMI to launch")
+    parser.add_argument("--instance-type", choices=list(INSTANCE_TYPES), help="EC2 instance type")
+    parser.add_argument("--region", choices=[ALLOWED_REGION], help=f"AWS region (default {ALLOWED_REGION})")
+    parser.add_argument("--az", choices=AVAILABILITY_ZONES, help="Availability zone")
+    parser.add_argument("--alb-name", type=_alb_name, help="Application Load Balancer name (max 32 characters)")
+    parser.add_argument("--dry-run", action="store_true", help="Show the Terraform plan without applying it")
+    parser.add_argument("--destroy", action="store_true", help="Destroy the resources after validation without prompting")
+    args = parser.parse_args(argv)
+    
+    if not all((args.ami, args.instance_type, args.az, args.alb_name)) and not sys.stdin.isatty():
+        parser.error("--ami, --instance-type, --az and --alb-name are required when not running interactively")
+    return args
+
+
 def main():
     """Main entry point."""
+    level_name = os.environ.get("LOGLEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    logging.basicConfig(level=level if isinstance(level, int) else logging.INFO, format="%(message)s")
+    if not isinstance(level, int):
+        log.warning("Unknown LOGLEVEL '%s', using INFO", level_name)
+    args = parse_args()
     try:
         deployer = AWSInfrastructureDeployer()
-        success = deployer.run()
+        success = deployer.run(args)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"Fatal error: {e}")